@@ -12,6 +12,7 @@ import HomeScreen from './src/screens/HomeScreen';
 import MapScreen from './src/screens/MapScreen';
 import CameraFeedScreen from './src/screens/CameraFeedScreen';
 import { RootStackParamList } from './src/types/navigation';
+import { STORAGE_KEYS } from './src/config';
 
 const Stack = createNativeStackNavigator<RootStackParamList>();
 
@@ -34,9 +35,11 @@ export default function App() {
     // 1. Check for previously saved User Data
     const checkUserData = async () => {
       try {
-        const name = await AsyncStorage.getItem('userName');
-        const phone = await AsyncStorage.getItem('userPhone');
-        const blindName = await AsyncStorage.getItem('blindName');
+        const [[, name], [, phone], [, blindName]] = await AsyncStorage.multiGet([
+          STORAGE_KEYS.userName,
+          STORAGE_KEYS.userPhone,
+          STORAGE_KEYS.blindName,
+        ]);
         if (name && phone && blindName) {
           setInitialRoute('Home');
         }
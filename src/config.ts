@@ -13,3 +13,10 @@ export const BACKEND_URL = `http://${BACKEND_IP}:${BACKEND_PORT}`;
 // Polling intervals (milliseconds)
 export const LOCATION_POLL_INTERVAL = 3000;    // Poll GPS every 3 seconds
 export const NOTIFICATION_POLL_INTERVAL = 2000; // Poll notifications every 2 seconds
+
+// AsyncStorage keys for the details saved during onboarding
+export const STORAGE_KEYS = {
+    userName: 'userName',
+    userPhone: 'userPhone',
+    blindName: 'blindName',
+} as const;
@@ -6,39 +6,52 @@ import { useNavigation } from '@react-navigation/native';
 import { LinearGradient } from 'expo-linear-gradient';
 import { BACKEND_URL, BACKEND_IP, BACKEND_PORT } from '../config';
 
+const snapshotUri = () => `${BACKEND_URL}/api/snapshot?t=${Date.now()}`;
+
 export default function CameraFeedScreen() {
     const navigation = useNavigation();
     const [isConnecting, setIsConnecting] = useState(true);
     const [isConnected, setIsConnected] = useState(false);
     const [isMuted, setIsMuted] = useState(false);
     const [isSpeakerOn, setIsSpeakerOn] = useState(true);
-    const [frameKey, setFrameKey] = useState(Date.now());
+    // Double-buffered feed: one slot is on screen while the other loads the next snapshot
+    const [frameUris, setFrameUris] = useState<[string, string]>(() => ['', snapshotUri()]);
+    const [frontSlot, setFrontSlot] = useState(0);
+    // URI of the snapshot currently loading; events for any other URI are replays and ignored
+    const pendingUriRef = useRef(frameUris[1]);
     const [fps, setFps] = useState(0);
     const frameTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
     const isActiveRef = useRef(true);
     const frameCountRef = useRef(0);
     const fpsTimerRef = useRef<ReturnType<typeof setInterval> | null>(null);
+    const statusCheckRef = useRef<AbortController | null>(null);
+
+    // Check if the backend video feed is available
+    const checkConnection = useCallback(async () => {
+        // A newer check (e.g. a Retry tap) supersedes any still in flight
+        statusCheckRef.current?.abort();
+        const controller = new AbortController();
+        statusCheckRef.current = controller;
+        try {
+            const response = await fetch(`${BACKEND_URL}/api/status`, { signal: controller.signal });
+            const data = await response.json();
+            if (controller.signal.aborted) return;
+            if (data.status === 'running') {
+                setIsConnected(true);
+            }
+        } catch (e) {
+            if (controller.signal.aborted) return;
+            console.log('Backend not reachable:', e);
+            setIsConnected(false);
+        } finally {
+            if (!controller.signal.aborted) setIsConnecting(false);
+        }
+    }, []);
 
     useEffect(() => {
         isActiveRef.current = true;
 
-        // Check if the backend video feed is available
-        const checkConnection = async () => {
-            try {
-                const response = await fetch(`${BACKEND_URL}/api/status`);
-                const data = await response.json();
-                if (data.status === 'running') {
-                    setIsConnected(true);
-                }
-            } catch (e) {
-                console.log('Backend not reachable:', e);
-                setIsConnected(false);
-            } finally {
-                setIsConnecting(false);
-            }
-        };
-
-        const timer = setTimeout(checkConnection, 1500);
+        checkConnection();
 
         // FPS counter
         fpsTimerRef.current = setInterval(() => {
@@ -48,30 +61,44 @@ export default function CameraFeedScreen() {
 
         return () => {
             isActiveRef.current = false;
-            clearTimeout(timer);
+            statusCheckRef.current?.abort();
             if (frameTimerRef.current) clearTimeout(frameTimerRef.current);
             if (fpsTimerRef.current) clearInterval(fpsTimerRef.current);
         };
+    }, [checkConnection]);
+
+    const loadFrameInto = useCallback((slot: number) => {
+        const uri = snapshotUri();
+        pendingUriRef.current = uri;
+        setFrameUris(prev => {
+            const next: [string, string] = [prev[0], prev[1]];
+            next[slot] = uri;
+            return next;
+        });
     }, []);
 
-    // When a frame loads, schedule the next one
-    const onFrameLoad = useCallback(() => {
-        frameCountRef.current++;
+    const scheduleFrame = useCallback((slot: number, delay: number) => {
+        if (frameTimerRef.current) clearTimeout(frameTimerRef.current);
         if (isActiveRef.current) {
-            frameTimerRef.current = setTimeout(() => {
-                setFrameKey(Date.now());
-            }, 100); // ~10 fps polling
+            frameTimerRef.current = setTimeout(() => loadFrameInto(slot), delay);
         }
-    }, []);
+    }, [loadFrameInto]);
+
+    // When a frame loads, swap it on screen and load the next one into the other slot
+    const onFrameLoad = useCallback((slot: number, uri: string) => {
+        if (uri !== pendingUriRef.current) return;
+        pendingUriRef.current = '';
+        frameCountRef.current++;
+        setFrontSlot(slot);
+        scheduleFrame(1 - slot, 100); // ~10 fps polling
+    }, [scheduleFrame]);
 
     // If a frame fails, retry after a short delay
-    const onFrameError = useCallback(() => {
-        if (isActiveRef.current) {
-            frameTimerRef.current = setTimeout(() => {
-                setFrameKey(Date.now());
-            }, 500);
-        }
-    }, []);
+    const onFrameError = useCallback((slot: number, uri: string) => {
+        if (uri !== pendingUriRef.current) return;
+        pendingUriRef.current = '';
+        scheduleFrame(slot, 500);
+    }, [scheduleFrame]);
 
     const handleHangUp = () => {
         navigation.goBack();
@@ -101,14 +128,16 @@ export default function CameraFeedScreen() {
                     </View>
                 ) : isConnected ? (
                     <View style={styles.feedContainer}>
-                        <Image
-                            key={frameKey}
-                            source={{ uri: `${BACKEND_URL}/api/snapshot?t=${frameKey}` }}
-                            style={styles.feedImage}
-                            resizeMode="cover"
-                            onLoad={onFrameLoad}
-                            onError={onFrameError}
-                        />
+                        {frameUris.map((uri, slot) => uri ? (
+                            <Image
+                                key={slot}
+                                source={{ uri }}
+                                style={[styles.feedImage, slot !== frontSlot && styles.feedImageHidden]}
+                                resizeMode="cover"
+                                onLoad={() => onFrameLoad(slot, uri)}
+                                onError={() => onFrameError(slot, uri)}
+                            />
+                        ) : null)}
                         <View style={styles.fpsCounter}>
                             <Text style={styles.fpsText}>{fps} FPS</Text>
                         </View>
@@ -125,14 +154,7 @@ export default function CameraFeedScreen() {
                             style={styles.retryButton}
                             onPress={() => {
                                 setIsConnecting(true);
-                                setTimeout(async () => {
-                                    try {
-                                        const resp = await fetch(`${BACKEND_URL}/api/status`);
-                                        const data = await resp.json();
-                                        if (data.status === 'running') setIsConnected(true);
-                                    } catch {}
-                                    setIsConnecting(false);
-                                }, 1500);
+                                checkConnection();
                             }}
                         >
                             <Text style={styles.retryText}>Retry Connection</Text>
@@ -241,8 +263,10 @@ const styles = StyleSheet.create({
         backgroundColor: '#000',
     },
     feedImage: {
-        flex: 1,
-        width: '100%',
+        ...StyleSheet.absoluteFillObject,
+    },
+    feedImageHidden: {
+        opacity: 0,
     },
     fpsCounter: {
         position: 'absolute',
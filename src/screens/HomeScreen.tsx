@@ -7,37 +7,69 @@ import { useNavigation } from '@react-navigation/native';
 import { RootStackParamList } from '../types/navigation';
 import { Ionicons } from '@expo/vector-icons';
 import { LinearGradient } from 'expo-linear-gradient';
-import { BACKEND_URL, NOTIFICATION_POLL_INTERVAL } from '../config';
+import { BACKEND_URL, NOTIFICATION_POLL_INTERVAL, STORAGE_KEYS } from '../config';
 
 type NavigationProp = NativeStackNavigationProp<RootStackParamList, 'Home'>;
 
+type BannerNotification = { title: string; message: string };
+
+// Each banner is on screen for ~4.3 s while notifications are polled every 2 s,
+// so cap the backlog rather than show alerts minutes after they arrived
+const MAX_QUEUED_BANNERS = 3;
+
 export default function HomeScreen() {
     const [userName, setUserName] = useState<string | null>('');
     const [blindName, setBlindName] = useState<string | null>('');
     const [blindPhone, setBlindPhone] = useState<string | null>('');
     const [isBackendConnected, setIsBackendConnected] = useState(false);
-    const [bannerNotif, setBannerNotif] = useState<{ title: string; message: string } | null>(null);
+    const [bannerNotif, setBannerNotif] = useState<BannerNotification | null>(null);
     const bannerAnim = useRef(new Animated.Value(-120)).current;
+    const bannerQueueRef = useRef<BannerNotification[]>([]);
+    const isBannerActiveRef = useRef(false);
     const navigation = useNavigation<NavigationProp>();
     const notifPollRef = useRef<ReturnType<typeof setInterval> | null>(null);
 
-    // Show in-app notification banner
-    const showBanner = (title: string, message: string) => {
-        setBannerNotif({ title, message });
+    // Show the next queued in-app notification banner, one at a time
+    const showNextBanner = () => {
+        const next = bannerQueueRef.current.shift();
+        if (!next) {
+            isBannerActiveRef.current = false;
+            setBannerNotif(null);
+            return;
+        }
+        isBannerActiveRef.current = true;
+        setBannerNotif(next);
         Vibration.vibrate(400);
         Animated.sequence([
             Animated.spring(bannerAnim, { toValue: 0, useNativeDriver: true, speed: 12 }),
             Animated.delay(4000),
             Animated.timing(bannerAnim, { toValue: -120, duration: 300, useNativeDriver: true }),
-        ]).start(() => setBannerNotif(null));
+        ]).start(showNextBanner);
+    };
+
+    // Queue a polled batch so its alerts are shown in turn instead of overwriting each other
+    const enqueueBanners = (notifications: any[]) => {
+        const queue = bannerQueueRef.current;
+        for (const notif of notifications) {
+            queue.push({
+                title: notif.title || '\u{1F6A8} VisionMate Alert',
+                message: notif.message,
+            });
+        }
+        if (queue.length > MAX_QUEUED_BANNERS) {
+            queue.splice(0, queue.length - MAX_QUEUED_BANNERS);
+        }
+        if (!isBannerActiveRef.current) showNextBanner();
     };
 
     useEffect(() => {
         const loadUserData = async () => {
             try {
-                const name = await AsyncStorage.getItem('userName');
-                const pName = await AsyncStorage.getItem('blindName');
-                const pPhone = await AsyncStorage.getItem('userPhone');
+                const [[, name], [, pName], [, pPhone]] = await AsyncStorage.multiGet([
+                    STORAGE_KEYS.userName,
+                    STORAGE_KEYS.blindName,
+                    STORAGE_KEYS.userPhone,
+                ]);
 
                 if (name) setUserName(name);
                 if (pName) setBlindName(pName);
@@ -59,12 +91,7 @@ export default function HomeScreen() {
                 setIsBackendConnected(true);
 
                 if (data.notifications && data.notifications.length > 0) {
-                    for (const notif of data.notifications) {
-                        showBanner(
-                            notif.title || '\u{1F6A8} VisionMate Alert',
-                            notif.message
-                        );
-                    }
+                    enqueueBanners(data.notifications);
                 }
             } catch (e) {
                 setIsBackendConnected(false);
@@ -5,7 +5,7 @@ import MapView, { Marker, PROVIDER_DEFAULT, Region } from 'react-native-maps';
 import AsyncStorage from '@react-native-async-storage/async-storage';
 import { Ionicons } from '@expo/vector-icons';
 import { useNavigation } from '@react-navigation/native';
-import { BACKEND_URL, LOCATION_POLL_INTERVAL } from '../config';
+import { BACKEND_URL, LOCATION_POLL_INTERVAL, STORAGE_KEYS } from '../config';
 
 export default function MapScreen() {
     const [userName, setUserName] = useState<string | null>(null);
@@ -22,8 +22,10 @@ export default function MapScreen() {
     useEffect(() => {
         const loadUserData = async () => {
             try {
-                const name = await AsyncStorage.getItem('userName');
-                const blindPerson = await AsyncStorage.getItem('blindName');
+                const [[, name], [, blindPerson]] = await AsyncStorage.multiGet([
+                    STORAGE_KEYS.userName,
+                    STORAGE_KEYS.blindName,
+                ]);
                 if (name) setUserName(name);
                 if (blindPerson) setBlindName(blindPerson);
             } catch (e) {
@@ -34,19 +36,25 @@ export default function MapScreen() {
         loadUserData();
 
         // Poll location from backend every 3 seconds
+        let lastPollFailed = false;
         const pollLocation = async () => {
             try {
                 const response = await fetch(`${BACKEND_URL}/api/location`);
                 const data = await response.json();
                 if (data.latitude && data.longitude) {
-                    setGlassesLocation({
-                        latitude: data.latitude,
-                        longitude: data.longitude,
-                    });
+                    // Keep the previous object when the glasses haven't moved so the map skips a re-render
+                    setGlassesLocation(prev =>
+                        prev.latitude === data.latitude && prev.longitude === data.longitude
+                            ? prev
+                            : { latitude: data.latitude, longitude: data.longitude }
+                    );
                     setIsConnected(true);
                 }
+                lastPollFailed = false;
             } catch (e) {
-                console.log('Location poll failed:', e);
+                // Only log when the connection drops, not on every retry while offline
+                if (!lastPollFailed) console.log('Location poll failed:', e);
+                lastPollFailed = true;
                 setIsConnected(false);
             }
         };
@@ -4,6 +4,7 @@ import { SafeAreaView } from 'react-native-safe-area-context';
 import AsyncStorage from '@react-native-async-storage/async-storage';
 import { NativeStackNavigationProp } from '@react-navigation/native-stack';
 import { RootStackParamList } from '../types/navigation';
+import { STORAGE_KEYS } from '../config';
 import { useNavigation } from '@react-navigation/native';
 import { LinearGradient } from 'expo-linear-gradient';
 import { Ionicons } from '@expo/vector-icons';
@@ -22,9 +23,11 @@ export default function OnboardingScreen() {
             return;
         }
         try {
-            await AsyncStorage.setItem('userName', name);
-            await AsyncStorage.setItem('userPhone', phone);
-            await AsyncStorage.setItem('blindName', blindName);
+            await AsyncStorage.multiSet([
+                [STORAGE_KEYS.userName, name],
+                [STORAGE_KEYS.userPhone, phone],
+                [STORAGE_KEYS.blindName, blindName],
+            ]);
             navigation.replace('Home');
         } catch (e) {
             Alert.alert('Error', 'Failed to save data. Please try again.');